@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures for the DevScape game tests.
+"""
+
+import os
+
+# Run pygame headless so tests work without a display (e.g. in CI).
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # pylint: disable=wrong-import-position
+import pytest  # pylint: disable=wrong-import-position
+from main import Game  # pylint: disable=wrong-import-position
+
+
+@pytest.fixture(scope="session")
+def pygame_init():
+    """Initializes pygame once for the test session and quits it afterwards."""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def game(pygame_init):  # pylint: disable=redefined-outer-name,unused-argument
+    """Returns a freshly constructed Game running on the dummy video driver."""
+    return Game()
@@ -5,6 +5,10 @@ Entry point for the game. Handles initialization, event loop, rendering, and
 integration with pixel art rendering and dialogue systems.
 """
 
+import functools
+import threading
+from concurrent.futures import Future
+
 import pygame
 from ollama_ai import get_llm_move
 
@@ -14,6 +18,23 @@ SCREEN_HEIGHT = 600
 TILE_SIZE = 32
 FPS = 60
 
+# Only these event types are queued by SDL; everything else is dropped
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED]
+
+# Tile offsets (dx, dy) for player keys and LLM move names
+KEY_MOVES = {
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+}
+LLM_MOVES = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -116,6 +137,20 @@ def render_pixel_art(surface, pixel_art_lines, rect):
                 surface.fill(color, pixel_rect)
 
 
+@functools.lru_cache(maxsize=None)
+def get_font(size):
+    """
+    Returns the default font at the given size, loading it only once.
+
+    Args:
+        size (int): The font size.
+
+    Returns:
+        pygame.font.Font: The cached font object.
+    """
+    return pygame.font.Font(pygame.font.get_default_font(), size)
+
+
 def draw_text(surface, text, size, rect, color=WHITE):
     """
     Draws text onto a surface, centered above a specified rect.
@@ -127,13 +162,39 @@ def draw_text(surface, text, size, rect, color=WHITE):
         rect (pygame.Rect): The rect to position the text relative to.
         color (tuple, optional): The color of the text. Defaults to WHITE.
     """
-    font = pygame.font.Font(pygame.font.get_default_font(), size)
+    font = get_font(size)
     text_surface = font.render(text, True, color)
     text_rect = text_surface.get_rect()
     text_rect.center = (rect.centerx, rect.top - 10)
     surface.blit(text_surface, text_rect)
 
 
+def run_in_background(func, *args):
+    """
+    Calls a function on a daemon thread and returns a future for its result.
+
+    Daemon threads do not hold the process open at exit, so a slow call
+    (such as an LLM request) never delays quitting the game.
+
+    Args:
+        func (callable): The function to call.
+        *args: Positional arguments passed to the function.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the function's return value.
+    """
+    future = Future()
+
+    def worker():
+        try:
+            future.set_result(func(*args))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
+
+
 class Game:
     """Core class to manage game state, logic, and rendering."""
 
@@ -144,9 +205,19 @@ class Game:
         pygame.display.set_caption("RuneScape-like Pixel Game")
         self.clock = pygame.time.Clock()
         self.running = True
+        # Set whenever something visible changes; render() clears it
+        self.needs_redraw = True
+
+        # Keep unhandled events (mouse motion, key up, ...) out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
 
-        self.map_width_pixels = len(GAME_MAP[0]) * TILE_SIZE
-        self.map_height_pixels = len(GAME_MAP) * TILE_SIZE
+        self.map_width = len(GAME_MAP[0])
+        self.map_height = len(GAME_MAP)
+        self.map_width_pixels = self.map_width * TILE_SIZE
+        self.map_height_pixels = self.map_height * TILE_SIZE
+        # Flat walkability bitmap indexed by y * map_width + x
+        self.walkable = bytearray(tile != "W" for row in GAME_MAP for tile in row)
 
         player_art = [
             "..HHHH..",
@@ -178,66 +249,118 @@ class Game:
 
         self.llm_move_timer = 0
         self.llm_move_interval = 2000  # in milliseconds
+        # Pending LLM request, run in the background so frames never block
+        self.llm_request = None
 
         self.camera_offset_x = 0
         self.camera_offset_y = 0
 
+        # Pre-rendered tile-sized surfaces, keyed by pixel art lines
+        self.art_cache = {}
+        # The map never changes, so resolve each tile's surface up front
+        self.tile_surfaces = [
+            [
+                (
+                    self.get_art_surface(TILE_ART_MAP[tile])
+                    if tile in TILE_ART_MAP
+                    else None
+                )
+                for tile in row
+            ]
+            for row in GAME_MAP
+        ]
+
+    def get_art_surface(self, pixel_art_lines):
+        """
+        Returns a tile-sized surface with the pixel art already drawn on it.
+
+        The art is rasterized with render_pixel_art the first time it is
+        requested and the resulting surface is reused for every later draw.
+
+        Args:
+            pixel_art_lines (list[str]): ASCII-like lines representing the art.
+
+        Returns:
+            pygame.Surface: The cached surface for this art.
+        """
+        key = tuple(pixel_art_lines)
+        surface = self.art_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            render_pixel_art(
+                surface, pixel_art_lines, pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE)
+            )
+            surface = surface.convert_alpha()
+            self.art_cache[key] = surface
+        return surface
+
+    def is_walkable(self, x, y):
+        """Returns True if the tile at (x, y) is inside the map and not water."""
+        if 0 <= x < self.map_width and 0 <= y < self.map_height:
+            return bool(self.walkable[y * self.map_width + x])
+        return False
+
     def handle_events(self):
         """Handles all user input and events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.needs_redraw = True
             elif event.type == pygame.KEYDOWN:
-                new_x, new_y = self.player.x, self.player.y
-                if event.key == pygame.K_UP:
-                    new_y -= 1
-                elif event.key == pygame.K_DOWN:
-                    new_y += 1
-                elif event.key == pygame.K_LEFT:
-                    new_x -= 1
-                elif event.key == pygame.K_RIGHT:
-                    new_x += 1
-
-                if (
-                    0 <= new_y < len(GAME_MAP)
-                    and 0 <= new_x < len(GAME_MAP[0])
-                    and GAME_MAP[new_y][new_x] != "W"
-                ):
-                    self.player.x, self.player.y = new_x, new_y
+                delta = KEY_MOVES.get(event.key)
+                if delta:
+                    new_x = self.player.x + delta[0]
+                    new_y = self.player.y + delta[1]
+                    if self.is_walkable(new_x, new_y):
+                        self.player.x, self.player.y = new_x, new_y
+                        self.needs_redraw = True
+
+    def apply_llm_move(self, move, dialogue):
+        """
+        Applies a move and line of dialogue chosen by the LLM character.
+
+        Args:
+            move (str): One of "up", "down", "left", "right" or "stay".
+            dialogue (str): The line of dialogue to display.
+        """
+        self.llm_dialogue = dialogue
+        self.llm_dialogue_timer = 0
+        self.needs_redraw = True
+
+        delta = LLM_MOVES.get(move)
+        if delta:
+            new_llm_x = self.llm_character.x + delta[0]
+            new_llm_y = self.llm_character.y + delta[1]
+            if self.is_walkable(new_llm_x, new_llm_y):
+                self.llm_character.x, self.llm_character.y = new_llm_x, new_llm_y
 
     def update(self, dt):
         """Updates the state of game objects."""
         self.llm_move_timer += dt
+
+        # Redraw once more when the dialogue bubble times out
+        showing_dialogue = self.llm_dialogue_timer < self.dialogue_duration
         self.llm_dialogue_timer += dt
+        if showing_dialogue and self.llm_dialogue_timer >= self.dialogue_duration:
+            self.needs_redraw = True
 
-        if self.llm_move_timer >= self.llm_move_interval:
+        # Apply the LLM's answer once the background request has finished
+        if self.llm_request is not None and self.llm_request.done():
+            move, dialogue = self.llm_request.result()
+            self.llm_request = None
+            self.apply_llm_move(move, dialogue)
+
+        if self.llm_request is None and self.llm_move_timer >= self.llm_move_interval:
             self.llm_move_timer = 0
-            move, dialogue = get_llm_move(
+            self.llm_request = run_in_background(
+                get_llm_move,
                 self.player.x,
                 self.player.y,
                 self.llm_character.x,
                 self.llm_character.y,
                 GAME_MAP,
             )
-            self.llm_dialogue = dialogue
-            self.llm_dialogue_timer = 0
-
-            new_llm_x, new_llm_y = self.llm_character.x, self.llm_character.y
-            if move == "up":
-                new_llm_y -= 1
-            elif move == "down":
-                new_llm_y += 1
-            elif move == "left":
-                new_llm_x -= 1
-            elif move == "right":
-                new_llm_x += 1
-
-            if (
-                0 <= new_llm_y < len(GAME_MAP)
-                and 0 <= new_llm_x < len(GAME_MAP[0])
-                and GAME_MAP[new_llm_y][new_llm_x] != "W"
-            ):
-                self.llm_character.x, self.llm_character.y = new_llm_x, new_llm_y
 
         # Update camera to center on player
         self.camera_offset_x = SCREEN_WIDTH // 2 - self.player.x * TILE_SIZE
@@ -253,48 +376,62 @@ class Game:
             self.camera_offset_y, SCREEN_HEIGHT - self.map_height_pixels
         )
 
+    def get_visible_tile_ranges(self):
+        """
+        Computes which map tiles overlap the screen for the current camera.
+
+        Returns:
+            tuple: (range, range) - The visible column and row indices.
+        """
+        first_col = max(0, -self.camera_offset_x // TILE_SIZE)
+        first_row = max(0, -self.camera_offset_y // TILE_SIZE)
+        last_col = min(
+            self.map_width,
+            (SCREEN_WIDTH - self.camera_offset_x + TILE_SIZE - 1) // TILE_SIZE,
+        )
+        last_row = min(
+            self.map_height,
+            (SCREEN_HEIGHT - self.camera_offset_y + TILE_SIZE - 1) // TILE_SIZE,
+        )
+        return range(first_col, last_col), range(first_row, last_row)
+
     def render(self):
         """Draws all game objects to the screen."""
         self.screen.fill(BLACK)
 
-        # Draw the map
-        for row_idx, row in enumerate(GAME_MAP):
-            for col_idx, tile_char in enumerate(row):
-                tile_art = TILE_ART_MAP.get(tile_char)
-                if tile_art:
+        # Collect every blit for the frame and submit them in one call
+        draws = []
+
+        # Draw the map, visiting only the tiles that overlap the screen
+        cols, rows = self.get_visible_tile_ranges()
+        for row_idx in rows:
+            row_surfaces = self.tile_surfaces[row_idx]
+            tile_screen_y = row_idx * TILE_SIZE + self.camera_offset_y
+            for col_idx in cols:
+                tile_surface = row_surfaces[col_idx]
+                if tile_surface is not None:
                     tile_screen_x = col_idx * TILE_SIZE + self.camera_offset_x
-                    tile_screen_y = row_idx * TILE_SIZE + self.camera_offset_y
-                    # Cull tiles that are off-screen
-                    if (
-                        -TILE_SIZE < tile_screen_x < SCREEN_WIDTH
-                        and -TILE_SIZE < tile_screen_y < SCREEN_HEIGHT
-                    ):
-                        render_pixel_art(
-                            self.screen,
-                            tile_art,
-                            pygame.Rect(
-                                tile_screen_x, tile_screen_y, TILE_SIZE, TILE_SIZE
-                            ),
-                        )
+                    draws.append((tile_surface, (tile_screen_x, tile_screen_y)))
 
         # Draw the player
         player_screen_x = self.player.x * TILE_SIZE + self.camera_offset_x
         player_screen_y = self.player.y * TILE_SIZE + self.camera_offset_y
-        render_pixel_art(
-            self.screen,
-            self.player.art,
-            pygame.Rect(player_screen_x, player_screen_y, TILE_SIZE, TILE_SIZE),
+        draws.append(
+            (self.get_art_surface(self.player.art), (player_screen_x, player_screen_y))
         )
 
         # Draw the LLM character
         llm_screen_x = self.llm_character.x * TILE_SIZE + self.camera_offset_x
         llm_screen_y = self.llm_character.y * TILE_SIZE + self.camera_offset_y
-        render_pixel_art(
-            self.screen,
-            self.llm_character.art,
-            pygame.Rect(llm_screen_x, llm_screen_y, TILE_SIZE, TILE_SIZE),
+        draws.append(
+            (
+                self.get_art_surface(self.llm_character.art),
+                (llm_screen_x, llm_screen_y),
+            )
         )
 
+        self.screen.blits(draws, doreturn=False)
+
         if self.llm_dialogue_timer < self.dialogue_duration:
             draw_text(
                 self.screen,
@@ -304,6 +441,7 @@ class Game:
             )
 
         pygame.display.flip()
+        self.needs_redraw = False
 
     def run(self):
         """Runs the main game loop."""
@@ -311,11 +449,15 @@ class Game:
             dt = self.clock.tick(FPS)
             self.handle_events()
             self.update(dt)
-            self.render()
+            # Skip drawing frames identical to the one already on screen
+            if self.needs_redraw:
+                self.render()
         self.shutdown()
 
     def shutdown(self):
         """Shuts down pygame."""
+        # Cached fonts are invalid once pygame.font is shut down
+        get_font.cache_clear()
         pygame.quit()
 
 
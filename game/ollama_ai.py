@@ -5,10 +5,48 @@ Provides a client to interact with a local Ollama model to generate
 AI character moves and dialogue for the game.
 """
 
+import functools
+
 import requests
 
 OLLAMA_API_URL = "http://localhost:11434/api/chat"
 MODEL_NAME = "llama2:latest"  # Use the model you have installed
+VALID_MOVES = frozenset({"up", "down", "left", "right", "stay"})
+
+
+# Idle characters often get the exact same reply; reuse earlier parses
+@functools.lru_cache(maxsize=512)
+def _parse_response_text(response_text):
+    """Parses an LLM response into its move and dialogue, cached by text."""
+    move = "stay"
+    dialogue = "..."
+
+    # Normalize case for parsing keywords
+    response_upper = response_text.upper()
+
+    # Find positions of keywords
+    move_pos = response_upper.find("MOVE:")
+    say_pos = response_upper.find("SAY:")
+
+    # Isolate the move part
+    if move_pos != -1:
+        # Find the end of the move part (either start of say or end of string)
+        end_pos = say_pos if (say_pos > move_pos) else len(response_text)
+        move_part = response_text[move_pos + 5 : end_pos].strip(" |")
+        parsed_move = move_part.strip().lower()
+        if parsed_move in VALID_MOVES:
+            move = parsed_move
+
+    # Isolate the say part
+    if say_pos != -1:
+        # Find the end of the say part (either start of move or end of string)
+        end_pos = move_pos if (move_pos > say_pos) else len(response_text)
+        dialogue_part = response_text[say_pos + 4 : end_pos].strip(" |")
+        dialogue = dialogue_part.strip()
+        if not dialogue:  # handle empty SAY:
+            dialogue = "..."
+
+    return move, dialogue
 
 
 class OllamaClient:
@@ -24,6 +62,8 @@ class OllamaClient:
         """
         self.api_url = api_url
         self.model = model
+        # Reuse one HTTP connection to Ollama across requests
+        self.session = requests.Session()
 
     def _build_prompt(self, player_x, player_y, llm_x, llm_y, game_map):
         """Builds the prompt for the LLM based on the game state."""
@@ -52,35 +92,7 @@ class OllamaClient:
 
     def _parse_response(self, response_text):
         """Parses the LLM's response to extract the move and dialogue."""
-        move = "stay"
-        dialogue = "..."
-
-        # Normalize case for parsing keywords
-        response_upper = response_text.upper()
-
-        # Find positions of keywords
-        move_pos = response_upper.find("MOVE:")
-        say_pos = response_upper.find("SAY:")
-
-        # Isolate the move part
-        if move_pos != -1:
-            # Find the end of the move part (either start of say or end of string)
-            end_pos = say_pos if (say_pos > move_pos) else len(response_text)
-            move_part = response_text[move_pos + 5:end_pos].strip(" |")
-            parsed_move = move_part.strip().lower()
-            if parsed_move in ["up", "down", "left", "right", "stay"]:
-                move = parsed_move
-
-        # Isolate the say part
-        if say_pos != -1:
-            # Find the end of the say part (either start of move or end of string)
-            end_pos = move_pos if (move_pos > say_pos) else len(response_text)
-            dialogue_part = response_text[say_pos + 4:end_pos].strip(" |")
-            dialogue = dialogue_part.strip()
-            if not dialogue: # handle empty SAY:
-                dialogue = "..."
-
-        return move, dialogue
+        return _parse_response_text(response_text)
 
     def get_move(self, player_x, player_y, llm_x, llm_y, game_map):
         """
@@ -97,7 +109,7 @@ class OllamaClient:
         }
 
         try:
-            response = requests.post(self.api_url, json=payload, timeout=15)
+            response = self.session.post(self.api_url, json=payload, timeout=15)
             response.raise_for_status()
             response_text = (
                 response.json().get("message", {}).get("content", "").strip()
@@ -109,14 +121,25 @@ class OllamaClient:
             return "stay", "I feel disconnected..."
 
 
+@functools.lru_cache(maxsize=None)
+def get_default_client():
+    """
+    Returns the shared OllamaClient, creating it on first use.
+
+    Returns:
+        OllamaClient: The module-wide client instance.
+    """
+    return OllamaClient()
+
+
 def get_llm_move(player_x, player_y, llm_x, llm_y, game_map):
     """
     Gets the next move and a line of dialogue for the LLM character.
 
-    This is a convenience wrapper around the OllamaClient.
+    This is a convenience wrapper around the shared OllamaClient.
 
     Returns:
         tuple: (str, str) - The chosen move and a line of dialogue.
     """
-    client = OllamaClient()
+    client = get_default_client()
     return client.get_move(player_x, player_y, llm_x, llm_y, game_map)
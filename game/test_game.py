@@ -1,18 +1,22 @@
 """
-Tests for the DevScape game, focusing on rendering functions.
+Tests for the DevScape game, focusing on rendering functions and movement.
 """
 
+import threading
+from unittest.mock import patch
+
 import pygame
 import pytest
-from main import COLOR_MAP, TILE_SIZE, TRANSPARENT, render_pixel_art
-
-
-@pytest.fixture(scope="module")
-def pygame_init():
-    """Initializes pygame for the test module and quits it after tests run."""
-    pygame.init()
-    yield
-    pygame.quit()
+from main import (
+    COLOR_MAP,
+    GAME_MAP,
+    TILE_ART_MAP,
+    TILE_SIZE,
+    TRANSPARENT,
+    get_font,
+    render_pixel_art,
+    run_in_background,
+)
 
 
 def test_render_pixel_art_basic(pygame_init):
@@ -105,3 +109,209 @@ def test_render_pixel_art_rounding_error(pygame_init):
     # Assert that the pixel is not transparent and has the correct color
     assert bottom_right_pixel_color[3] == 255
     assert bottom_right_pixel_color[:3] == expected_color[:3]
+
+
+def test_get_font_is_cached(pygame_init):
+    """Tests that get_font loads each font size once and reuses it."""
+    assert get_font(18) is get_font(18)
+    assert get_font(18) is not get_font(24)
+
+
+def test_is_walkable(game):
+    """Tests that is_walkable rejects water tiles and positions off the map."""
+    assert GAME_MAP[0][0] == "G"
+    assert game.is_walkable(0, 0)
+    assert GAME_MAP[5][10] == "W"
+    assert not game.is_walkable(10, 5)
+    assert not game.is_walkable(-1, 0)
+    assert not game.is_walkable(0, -1)
+    assert not game.is_walkable(game.map_width, 0)
+    assert not game.is_walkable(0, game.map_height)
+
+
+@pytest.mark.usefixtures("game")
+def test_game_blocks_unhandled_events():
+    """Tests that only the events Game handles are queued by SDL."""
+    assert not pygame.event.get_blocked(pygame.QUIT)
+    assert not pygame.event.get_blocked(pygame.KEYDOWN)
+    assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+    assert pygame.event.get_blocked(pygame.KEYUP)
+
+
+@pytest.mark.parametrize("offset_x, offset_y", [(0, 0), (-16, -40), (-480, -40)])
+def test_get_visible_tile_ranges(game, offset_x, offset_y):
+    """Tests that the visible tile ranges match a per-tile on-screen check."""
+    game.camera_offset_x = offset_x
+    game.camera_offset_y = offset_y
+    cols, rows = game.get_visible_tile_ranges()
+    screen_width, screen_height = game.screen.get_size()
+
+    expected_cols = [
+        col
+        for col in range(game.map_width)
+        if -TILE_SIZE < col * TILE_SIZE + offset_x < screen_width
+    ]
+    expected_rows = [
+        row
+        for row in range(game.map_height)
+        if -TILE_SIZE < row * TILE_SIZE + offset_y < screen_height
+    ]
+    assert list(cols) == expected_cols
+    assert list(rows) == expected_rows
+
+
+def test_get_art_surface_matches_render_pixel_art(game):
+    """Tests that cached art surfaces hold the same pixels render_pixel_art draws."""
+    pixel_art = ["X.X", ".X.", "X.X"]
+    expected = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    expected.fill(TRANSPARENT)
+    render_pixel_art(expected, pixel_art, pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE))
+
+    surface = game.get_art_surface(pixel_art)
+    assert surface.get_size() == (TILE_SIZE, TILE_SIZE)
+    for x in range(TILE_SIZE):
+        for y in range(TILE_SIZE):
+            assert surface.get_at((x, y)) == expected.get_at((x, y))
+
+    # The same art (even as a different list object) reuses the cached surface
+    assert game.get_art_surface(list(pixel_art)) is surface
+
+
+def test_render_draws_map_and_player(game):
+    """Tests that render draws the visible map tiles and the player's art."""
+    game.update(0)
+    game.render()
+
+    # The first tile fully on screen is grass, whose first art pixel is dark green
+    col = (TILE_SIZE - 1 - game.camera_offset_x) // TILE_SIZE
+    row = (TILE_SIZE - 1 - game.camera_offset_y) // TILE_SIZE
+    assert GAME_MAP[row][col] == "G"
+    tile_x = col * TILE_SIZE + game.camera_offset_x
+    tile_y = row * TILE_SIZE + game.camera_offset_y
+    assert game.screen.get_at((tile_x + 1, tile_y + 1))[:3] == COLOR_MAP["G"][:3]
+
+    # Sample the centre of each art pixel in the player's tile
+    pixel = TILE_SIZE // len(game.player.art)
+    player_x = game.player.x * TILE_SIZE + game.camera_offset_x
+    player_y = game.player.y * TILE_SIZE + game.camera_offset_y
+    for row_idx, line in enumerate(game.player.art):
+        for col_idx, char in enumerate(line):
+            if char != ".":
+                actual = game.screen.get_at(
+                    (
+                        player_x + col_idx * pixel + pixel // 2,
+                        player_y + row_idx * pixel + pixel // 2,
+                    )
+                )
+                assert actual[:3] == COLOR_MAP[char][:3]
+
+
+def test_update_requests_llm_move_without_blocking(game):
+    """Tests that update keeps running while the LLM request is in flight."""
+    release = threading.Event()
+
+    def slow_llm_move(*_args):
+        release.wait(timeout=5)
+        return "left", "Over here!"
+
+    start_x = game.llm_character.x
+    with patch("main.get_llm_move", side_effect=slow_llm_move):
+        game.update(game.llm_move_interval)
+        request = game.llm_request
+        assert request is not None
+
+        # Frames keep updating while the request is outstanding
+        game.update(16)
+        assert game.llm_request is request
+        assert game.llm_character.x == start_x
+
+        release.set()
+        request.result(timeout=5)
+        game.update(16)
+
+    assert game.llm_request is None
+    assert game.llm_character.x == start_x - 1
+    assert game.llm_dialogue == "Over here!"
+    assert game.llm_dialogue_timer == 0
+
+
+@pytest.mark.parametrize(
+    "key, dx, dy",
+    [
+        (pygame.K_UP, 0, -1),
+        (pygame.K_DOWN, 0, 1),
+        (pygame.K_LEFT, -1, 0),
+        (pygame.K_RIGHT, 1, 0),
+        (pygame.K_SPACE, 0, 0),
+    ],
+)
+def test_handle_events_moves_player(game, key, dx, dy):
+    """Tests that arrow keys move the player one tile and other keys do not."""
+    start_x, start_y = game.player.x, game.player.y
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+    game.handle_events()
+    assert (game.player.x, game.player.y) == (start_x + dx, start_y + dy)
+
+
+def test_apply_llm_move_blocked_by_water(game):
+    """Tests that the LLM character cannot move onto water but still speaks."""
+    assert GAME_MAP[12][10] == "W"
+    game.llm_character.x, game.llm_character.y = 10, 13
+    game.apply_llm_move("up", "Can't swim!")
+    assert (game.llm_character.x, game.llm_character.y) == (10, 13)
+    assert game.llm_dialogue == "Can't swim!"
+
+
+def test_tile_surfaces_match_game_map(game):
+    """Tests that every map tile is pre-resolved to its cached art surface."""
+    assert len(game.tile_surfaces) == len(GAME_MAP)
+    for row, surfaces in zip(GAME_MAP, game.tile_surfaces):
+        assert len(surfaces) == len(row)
+        for tile, surface in zip(row, surfaces):
+            assert surface is game.get_art_surface(TILE_ART_MAP[tile])
+
+
+def test_needs_redraw_tracks_visible_changes(game):
+    """Tests that frames are only marked for redraw when something changes."""
+    game.llm_move_interval = float("inf")  # keep the LLM out of this test
+    assert game.needs_redraw
+    game.update(0)
+    game.render()
+    assert not game.needs_redraw
+
+    # Time passing without any visible change does not need a redraw
+    game.update(16)
+    assert not game.needs_redraw
+
+    # Player movement does
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT))
+    game.handle_events()
+    assert game.needs_redraw
+    game.render()
+
+    # New LLM dialogue does, and so does that dialogue timing out
+    game.apply_llm_move("stay", "Hello!")
+    assert game.needs_redraw
+    game.render()
+    game.update(game.dialogue_duration - 1)
+    assert not game.needs_redraw
+    game.update(1)
+    assert game.needs_redraw
+
+
+def test_run_in_background_uses_daemon_thread():
+    """Tests that background calls run on daemon threads and report results."""
+    seen = {}
+
+    def record_thread(value):
+        seen["daemon"] = threading.current_thread().daemon
+        return value * 2
+
+    assert run_in_background(record_thread, 21).result(timeout=5) == 42
+    assert seen["daemon"]
+
+    failing = run_in_background(int, "not a number")
+    with pytest.raises(ValueError):
+        failing.result(timeout=5)
@@ -2,48 +2,61 @@
 Tests for the Ollama AI client.
 """
 
+from unittest.mock import MagicMock
+
 import pytest
-from ollama_ai import OllamaClient
+from ollama_ai import OllamaClient, get_default_client
+
 
 @pytest.fixture
 def client():
     """Returns an OllamaClient instance for testing."""
     return OllamaClient()
 
-def test_parse_response_flexible(client):
+
+@pytest.mark.parametrize(
+    "response_text, expected_move, expected_dialogue",
+    [
+        # Standard response
+        ("MOVE: up | SAY: Hello there!", "up", "Hello there!"),
+        # Extra whitespace
+        ("  MOVE:  down   |  SAY:   I'm moving down.  ", "down", "I'm moving down."),
+        # Missing dialogue
+        ("MOVE: left", "left", "..."),
+        # Only dialogue
+        ("SAY: I'll just stay here.", "stay", "I'll just stay here."),
+        # Malformed response
+        ("I'm going right.", "stay", "..."),
+        # Reversed order
+        ("SAY: I'm heading down! | MOVE: down", "down", "I'm heading down!"),
+    ],
+)
+def test_parse_response_flexible(
+    client, response_text, expected_move, expected_dialogue
+):
     """Tests that _parse_response can handle flexible and malformed responses."""
-    # Test case 1: Standard response
-    response_text_1 = "MOVE: up | SAY: Hello there!"
-    move, dialogue = client._parse_response(response_text_1)
-    assert move == "up"
-    assert dialogue == "Hello there!"
-
-    # Test case 2: Extra whitespace
-    response_text_2 = "  MOVE:  down   |  SAY:   I'm moving down.  "
-    move, dialogue = client._parse_response(response_text_2)
-    assert move == "down"
-    assert dialogue == "I'm moving down."
-
-    # Test case 3: Missing dialogue
-    response_text_3 = "MOVE: left"
-    move, dialogue = client._parse_response(response_text_3)
-    assert move == "left"
-    assert dialogue == "..."
-
-    # Test case 4: Only dialogue
-    response_text_4 = "SAY: I'll just stay here."
-    move, dialogue = client._parse_response(response_text_4)
-    assert move == "stay"
-    assert dialogue == "I'll just stay here."
-
-    # Test case 5: Malformed response
-    response_text_5 = "I'm going right."
-    move, dialogue = client._parse_response(response_text_5)
-    assert move == "stay"
-    assert dialogue == "..."
-
-    # Test case 6: Reversed order
-    response_text_6 = "SAY: I'm heading down! | MOVE: down"
-    move, dialogue = client._parse_response(response_text_6)
-    assert move == "down"
-    assert dialogue == "I'm heading down!"
\ No newline at end of file
+    move, dialogue = client._parse_response(response_text)
+    assert move == expected_move
+    assert dialogue == expected_dialogue
+
+
+def test_get_move_uses_session(client):
+    """Tests that get_move posts through the client's persistent session."""
+    client.session = MagicMock()
+    client.session.post.return_value.json.return_value = {
+        "message": {"content": "MOVE: left | SAY: Over here!"}
+    }
+    move, dialogue = client.get_move(1, 1, 2, 2, ["GGG", "GGG", "GGG"])
+    assert (move, dialogue) == ("left", "Over here!")
+    client.session.post.assert_called_once()
+
+
+def test_get_default_client_is_shared():
+    """Tests that get_default_client returns the same client every time."""
+    assert get_default_client() is get_default_client()
+
+
+def test_parse_response_is_cached():
+    """Tests that repeated responses reuse the earlier parse for any client."""
+    first = OllamaClient()._parse_response("MOVE: stay | SAY: Zzz...")
+    assert OllamaClient()._parse_response("MOVE: stay | SAY: Zzz...") is first